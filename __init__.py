@@ -7,12 +7,24 @@ from comfy_api.latest import ComfyExtension
 
 from .checkpoint_loader import LoaderExtension as _CheckpointExtension
 from .diffusion_model_loader import DiffusionModelExtension as _DiffusionExtension
+from .io_scheduler import register_routes as _register_io_routes
 from .lora_loader import LoraExtension as _LoraExtension
+from .selection_api import register_routes as _register_selection_routes
+from .shared_cache import hook_model_unload as _hook_model_unload
+from .shared_cache import register_routes as _register_cache_routes
 from .vae_loader import VAEExtension as _VAEExtension
 
 # Expose web assets so ComfyUI loads the tree-selector JS.
 WEB_DIRECTORY = os.path.join(os.path.dirname(__file__), "web")
 
+# Bulk selection pre-validation endpoint for schedulers (POST /sk_loader/resolve).
+_register_selection_routes()
+# I/O scheduler queue depth and wait times (GET /sk_loader/io_metrics).
+_register_io_routes()
+# Release the shared model cache on ComfyUI's "free models" and on POST /sk_loader/free_cache.
+_hook_model_unload()
+_register_cache_routes()
+
 
 class SKLoaderExtension(ComfyExtension):
     def __init__(self):
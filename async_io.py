@@ -0,0 +1,20 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from .cache_utils import env_float
+
+# Worker threads used for path resolution and file reads of the SK loader nodes.
+IO_WORKERS_ENV = "SK_LOADER_IO_WORKERS"
+
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(1, int(env_float(IO_WORKERS_ENV, 4))),
+    thread_name_prefix="sk_loader_io",
+)
+
+
+async def run_io(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on the shared I/O executor so independent loader nodes overlap."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(func, *args, **kwargs))
@@ -0,0 +1,97 @@
+import hashlib
+import logging
+import math
+import os
+import shutil
+import tempfile
+
+import folder_paths
+
+
+# Environment variable overriding where derived artifacts are written.
+CACHE_DIR_ENV = "SK_LOADER_CACHE_DIR"
+
+# Bytes hashed from the head and tail of a file when fingerprinting it.
+FINGERPRINT_CHUNK = 1 << 20
+
+
+def env_float(name: str, default: float) -> float:
+    """Numeric setting from the environment; malformed values log a warning and use the default."""
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        value = float(raw)
+        if math.isfinite(value):
+            return value
+    except ValueError:
+        pass
+    logging.warning(f"SK Loader: ignoring invalid {name}={raw!r}, using {default}")
+    return default
+
+
+def cache_root(*parts: str) -> str:
+    """Return (and create) a directory under the SK Loader cache root."""
+    root = os.environ.get(CACHE_DIR_ENV) or os.path.join(folder_paths.models_dir, ".sk_cache")
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def file_fingerprint(path: str) -> str:
+    """Cheap content hash of a model file: size, mtime and the first/last chunk of bytes."""
+    st = os.stat(path)
+    h = hashlib.sha256()
+    h.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+    with open(path, "rb") as f:
+        h.update(f.read(FINGERPRINT_CHUNK))
+        if st.st_size > FINGERPRINT_CHUNK * 2:
+            f.seek(-FINGERPRINT_CHUNK, os.SEEK_END)
+            h.update(f.read(FINGERPRINT_CHUNK))
+    return h.hexdigest()[:32]
+
+
+def cache_entry_prefix(src_path: str) -> str:
+    """Name prefix shared by every cache entry derived from one source path."""
+    stem = os.path.splitext(os.path.basename(src_path))[0]
+    return f"{stem}.{hashlib.sha1(os.path.realpath(src_path).encode('utf-8')).hexdigest()[:8]}."
+
+
+def remove_stale_entries(parent: str, src_path: str, fingerprint: str) -> None:
+    """Delete entries derived from src_path whose fingerprint no longer matches the file."""
+    prefix = cache_entry_prefix(src_path)
+    try:
+        names = os.listdir(parent)
+    except OSError:
+        return
+    for name in names:
+        if not name.startswith(prefix) or name.startswith(prefix + fingerprint) or name.endswith(".tmp"):
+            continue
+        path = os.path.join(parent, name)
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+            logging.info(f"SK Loader: removed stale cache entry {path}")
+        except OSError as e:
+            logging.warning(f"SK Loader: could not remove stale cache entry {path}: {e}")
+
+
+def atomic_save_torch_file(sd: dict, path: str, metadata: dict | None = None) -> str:
+    """Write a safetensors file via a temp name so readers never see a partial file.
+
+    The temp file is unique per call, so concurrent writers of the same path (other
+    threads or processes) never share it; the last os.replace wins with a complete file.
+    """
+    import comfy.utils
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path))
+    os.close(fd)
+    try:
+        comfy.utils.save_torch_file(sd, tmp_path, metadata=metadata)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
@@ -4,6 +4,10 @@ from comfy_api.latest import ComfyExtension, io
 
 import folder_paths
 
+from .async_io import run_io
+from .component_cache import plan_checkpoint_read, read_checkpoint
+from .io_scheduler import get_io_scheduler
+from .shared_cache import get_shared_cache, make_key
 from .tree_utils import attach_tree_metadata, build_tree, list_files, resolve_selected_path
 
 
@@ -18,6 +22,62 @@ def build_file_input(input_id: str, folder_type: str, tooltip: str | None = None
     return attach_tree_metadata(combo, tree, tooltip=tooltip or "Select file")
 
 
+async def read_checkpoint_shared(
+    ckpt_path: str, output_model: bool, output_clip: bool, output_vae: bool, output_clipvision: bool
+) -> tuple[dict, dict | None]:
+    """Read a checkpoint state dict through the I/O scheduler.
+
+    The read is keyed on file identity and the component set actually read, not on the
+    requested outputs, so concurrent loads of one checkpoint (e.g. Simple and unCLIP)
+    share a single read. Each caller gets its own shallow copy of the state dict, since
+    comfy pops keys from it while building models.
+    """
+    components, size = await run_io(
+        plan_checkpoint_read, ckpt_path, output_model, output_clip, output_vae, output_clipvision
+    )
+    key = await run_io(make_key, "checkpoint_read", ckpt_path, components=components)
+    sd, metadata = await get_io_scheduler().submit(key, size, lambda: run_io(read_checkpoint, ckpt_path, components))
+    return dict(sd), metadata
+
+
+async def load_checkpoint_async(
+    ckpt_path: str,
+    output_model: bool = True,
+    output_clip: bool = True,
+    output_vae: bool = True,
+    output_clipvision: bool = False,
+) -> tuple:
+    """Read the checkpoint on the I/O executor, then build MODEL/CLIP/VAE(/CLIP_VISION) from it."""
+    import comfy.sd
+
+    async def _load() -> tuple:
+        # Only the read is scheduled and shared; the models are built per set of outputs.
+        sd, metadata = await read_checkpoint_shared(ckpt_path, output_model, output_clip, output_vae, output_clipvision)
+        out = comfy.sd.load_state_dict_guess_config(
+            sd,
+            output_vae=output_vae,
+            output_clip=output_clip,
+            output_clipvision=output_clipvision,
+            embedding_directory=folder_paths.get_folder_paths("embeddings"),
+            output_model=output_model,
+            metadata=metadata,
+        )
+        if out is None:
+            raise RuntimeError(f"ERROR: Could not detect model type of: {ckpt_path}")
+        return out
+
+    key = await run_io(
+        make_key,
+        "checkpoint",
+        ckpt_path,
+        output_model=output_model,
+        output_vae=output_vae,
+        output_clip=output_clip,
+        output_clipvision=output_clipvision,
+    )
+    return await get_shared_cache().aget_or_load(key, _load)
+
+
 class CheckpointLoader(io.ComfyNode):
     CATEGORY = "SK Loader/Advanced"
 
@@ -39,18 +99,25 @@ class CheckpointLoader(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, config_name: str, ckpt: dict | str) -> io.NodeOutput:
+    async def execute(cls, config_name: str, ckpt: dict | str) -> io.NodeOutput:
         import comfy.sd
 
-        config_path = folder_paths.get_full_path("configs", config_name)
-        ckpt_path = resolve_selected_path("checkpoints", ckpt, "ckpt", "ckpt")
-        loaded = comfy.sd.load_checkpoint(
-            config_path,
-            ckpt_path,
-            output_vae=True,
-            output_clip=True,
-            embedding_directory=folder_paths.get_folder_paths("embeddings"),
-        )
+        config_path = await run_io(folder_paths.get_full_path, "configs", config_name)
+        ckpt_path = await run_io(resolve_selected_path, "checkpoints", ckpt, "ckpt", "ckpt")
+        key = await run_io(make_key, "checkpoint", ckpt_path, config=config_path)
+
+        async def _load() -> tuple:
+            # comfy.sd reads the file inside load_checkpoint, so the whole call runs on the I/O executor.
+            return await run_io(
+                comfy.sd.load_checkpoint,
+                config_path,
+                ckpt_path,
+                output_vae=True,
+                output_clip=True,
+                embedding_directory=folder_paths.get_folder_paths("embeddings"),
+            )
+
+        loaded = await get_shared_cache().aget_or_load(key, lambda: get_io_scheduler().schedule(key, ckpt_path, _load))
         return io.NodeOutput(*loaded)
 
 
@@ -75,16 +142,9 @@ class CheckpointLoaderSimple(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, ckpt: dict | str) -> io.NodeOutput:
-        import comfy.sd
-
-        ckpt_path = resolve_selected_path("checkpoints", ckpt, "ckpt", "ckpt")
-        out = comfy.sd.load_checkpoint_guess_config(
-            ckpt_path,
-            output_vae=True,
-            output_clip=True,
-            embedding_directory=folder_paths.get_folder_paths("embeddings"),
-        )
+    async def execute(cls, ckpt: dict | str) -> io.NodeOutput:
+        ckpt_path = await run_io(resolve_selected_path, "checkpoints", ckpt, "ckpt", "ckpt")
+        out = await load_checkpoint_async(ckpt_path, output_clipvision=False)
         return io.NodeOutput(*out[:3])
 
 
@@ -109,18 +169,42 @@ class unCLIPCheckpointLoader(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, ckpt: dict | str) -> io.NodeOutput:
-        import comfy.sd
+    async def execute(cls, ckpt: dict | str) -> io.NodeOutput:
+        ckpt_path = await run_io(resolve_selected_path, "checkpoints", ckpt, "ckpt", "ckpt")
+        out = await load_checkpoint_async(ckpt_path, output_clipvision=True)
+        return io.NodeOutput(*out)
 
-        ckpt_path = resolve_selected_path("checkpoints", ckpt, "ckpt", "ckpt")
-        out = comfy.sd.load_checkpoint_guess_config(
-            ckpt_path,
-            output_vae=True,
-            output_clip=True,
-            output_clipvision=True,
-            embedding_directory=folder_paths.get_folder_paths("embeddings"),
+
+class CheckpointComponentLoader(io.ComfyNode):
+    CATEGORY = "SK Loader"
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="SK_CheckpointComponentLoader",
+            display_name="[SK] Checkpoint Components",
+            category="SK Loader",
+            inputs=[
+                build_file_input("ckpt", "checkpoints", tooltip="The checkpoint (model) to load."),
+                io.Boolean.Input("load_model", default=True, tooltip="Load the diffusion model."),
+                io.Boolean.Input("load_clip", default=True, tooltip="Load the text encoder."),
+                io.Boolean.Input("load_vae", default=True, tooltip="Load the VAE."),
+            ],
+            outputs=[
+                io.Model.Output(),
+                io.Clip.Output(),
+                io.Vae.Output(),
+            ],
+            description="Loads only the selected parts of a checkpoint. With SK_LOADER_SPLIT_CACHE set, components are cached as separate files so unused parts are never read.",
         )
-        return io.NodeOutput(*out)
+
+    @classmethod
+    async def execute(cls, ckpt: dict | str, load_model: bool, load_clip: bool, load_vae: bool) -> io.NodeOutput:
+        ckpt_path = await run_io(resolve_selected_path, "checkpoints", ckpt, "ckpt", "ckpt")
+        out = await load_checkpoint_async(
+            ckpt_path, output_model=load_model, output_clip=load_clip, output_vae=load_vae
+        )
+        return io.NodeOutput(*out[:3])
 
 
 class LoaderExtension(ComfyExtension):
@@ -130,6 +214,7 @@ class LoaderExtension(ComfyExtension):
             CheckpointLoader,
             CheckpointLoaderSimple,
             unCLIPCheckpointLoader,
+            CheckpointComponentLoader,
         ]
 
 
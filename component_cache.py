@@ -0,0 +1,224 @@
+import json
+import logging
+import os
+import struct
+import tempfile
+
+from .cache_utils import atomic_save_torch_file, cache_entry_prefix, cache_root, file_fingerprint, remove_stale_entries
+
+# Set to split checkpoints into per-component cache files on first load.
+SPLIT_CACHE_ENV = "SK_LOADER_SPLIT_CACHE"
+
+# Component files written per checkpoint; "other" holds keys no component claims.
+COMPONENTS = ("model", "clip", "vae", "clipvision", "other")
+
+MANIFEST_NAME = "manifest.json"
+
+# safetensors header dtype -> torch dtype attribute name.
+_SAFETENSORS_DTYPES = {
+    "F64": "float64",
+    "F32": "float32",
+    "F16": "float16",
+    "BF16": "bfloat16",
+    "F8_E4M3": "float8_e4m3fn",
+    "F8_E5M2": "float8_e5m2",
+    "I64": "int64",
+    "I32": "int32",
+    "I16": "int16",
+    "I8": "int8",
+    "U8": "uint8",
+    "BOOL": "bool",
+}
+
+
+def split_cache_enabled() -> bool:
+    return os.environ.get(SPLIT_CACHE_ENV, "") not in ("", "0")
+
+
+def _component_prefixes(sd: dict) -> dict[str, list[str]] | None:
+    """Key prefixes of each checkpoint component, as detected by comfy's model detection."""
+    import comfy.model_detection
+
+    unet_prefix = comfy.model_detection.unet_prefix_from_state_dict(sd)
+    model_config = comfy.model_detection.model_config_from_unet(sd, unet_prefix)
+    if model_config is None:
+        return None
+    clip_vision_prefix = getattr(model_config, "clip_vision_prefix", None)
+    return {
+        "model": [unet_prefix],
+        "clip": list(getattr(model_config, "text_encoder_key_prefix", [])),
+        "vae": list(getattr(model_config, "vae_key_prefix", [])),
+        "clipvision": [clip_vision_prefix] if clip_vision_prefix else [],
+    }
+
+
+def _split_state_dict(sd: dict) -> dict[str, dict] | None:
+    prefixes = _component_prefixes(sd)
+    if prefixes is None:
+        return None
+    parts: dict[str, dict] = {name: {} for name in COMPONENTS}
+    for k, v in sd.items():
+        name = next((n for n, pres in prefixes.items() if any(k.startswith(p) for p in pres)), "other")
+        parts[name][k] = v.contiguous()
+    return parts
+
+
+def _component_dir(ckpt_path: str) -> tuple[str, str]:
+    """(cache directory, fingerprint) for a checkpoint; raises OSError if the cache is unusable."""
+    fingerprint = file_fingerprint(ckpt_path)
+    return cache_root("components", f"{cache_entry_prefix(ckpt_path)}{fingerprint}"), fingerprint
+
+
+def _load_manifest(split_dir: str) -> dict | None:
+    """The split manifest, or None when it is missing, unreadable or any component file is gone."""
+    try:
+        with open(os.path.join(split_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    components = manifest.get("components") if isinstance(manifest, dict) else None
+    if not isinstance(components, list):
+        return None
+    if not all(os.path.isfile(os.path.join(split_dir, f"{name}.safetensors")) for name in components):
+        return None
+    return manifest
+
+
+def _wanted_components(output_model: bool, output_clip: bool, output_vae: bool, output_clipvision: bool) -> set[str]:
+    # The UNet file is always consulted for model detection; unrequested it is read as header-only placeholders.
+    wanted = {"other", "model"}
+    if output_clip:
+        wanted.add("clip")
+    if output_vae:
+        wanted.add("vae")
+    if output_clipvision:
+        wanted.add("clipvision")
+    return wanted
+
+
+def _write_split(ckpt_path: str, split_dir: str, fingerprint: str, sd: dict, metadata: dict | None) -> None:
+    """Write component files and the manifest for an already-loaded checkpoint state dict."""
+    try:
+        parts = _split_state_dict(sd)
+        if parts is None:
+            return
+        written = []
+        for name, part in parts.items():
+            if part:
+                atomic_save_torch_file(part, os.path.join(split_dir, f"{name}.safetensors"), metadata=metadata)
+                written.append(name)
+        # Concurrent splits of one checkpoint each write their own temp files; every replace is
+        # atomic, so the manifest only ever points at complete component files.
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{MANIFEST_NAME}.", suffix=".tmp", dir=split_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"source": ckpt_path, "components": written, "metadata": metadata}, f)
+            os.replace(tmp_path, os.path.join(split_dir, MANIFEST_NAME))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except Exception as e:
+        logging.warning(f"SK Loader: could not split {ckpt_path} into components: {e}")
+        return
+    remove_stale_entries(os.path.dirname(split_dir), ckpt_path, fingerprint)
+    logging.info(f"SK Loader: split {ckpt_path} into {', '.join(written)} at {split_dir}")
+
+
+def plan_checkpoint_read(
+    ckpt_path: str, output_model: bool, output_clip: bool, output_vae: bool, output_clipvision: bool
+) -> tuple[tuple | None, int]:
+    """(components, bytes) that read_checkpoint should read for the requested outputs.
+
+    components is None when the whole checkpoint is read (split cache off, not split
+    yet, or unusable); otherwise it is a sorted tuple of (component, header_only)
+    pairs from the split cache, and bytes counts only the tensor data actually read.
+    """
+    try:
+        whole = os.path.getsize(ckpt_path)
+    except OSError:
+        whole = 0
+    if not split_cache_enabled():
+        return None, whole
+    try:
+        split_dir, _ = _component_dir(ckpt_path)
+        manifest = _load_manifest(split_dir)
+        if manifest is None:
+            return None, whole
+        wanted = _wanted_components(output_model, output_clip, output_vae, output_clipvision)
+        components = tuple(
+            sorted((name, name == "model" and not output_model) for name in manifest["components"] if name in wanted)
+        )
+        size = sum(
+            os.path.getsize(os.path.join(split_dir, f"{name}.safetensors"))
+            for name, header_only in components
+            if not header_only
+        )
+        return components, size
+    except OSError:
+        return None, whole
+
+
+def read_checkpoint(ckpt_path: str, components: tuple | None = None) -> tuple[dict, dict | None]:
+    """Read a checkpoint state dict, through the component split cache when it is enabled.
+
+    With components from plan_checkpoint_read only those component files are read. With
+    None the whole checkpoint is read once and, when the split cache is enabled but not
+    populated yet, split to disk before the same state dict is returned. A split that
+    became unusable since planning falls back to the whole checkpoint.
+    """
+    import comfy.utils
+
+    if not split_cache_enabled():
+        return comfy.utils.load_torch_file(ckpt_path, return_metadata=True)
+
+    try:
+        split_dir, fingerprint = _component_dir(ckpt_path)
+    except OSError as e:
+        logging.warning(f"SK Loader: component cache unavailable, loading {ckpt_path} whole: {e}")
+        return comfy.utils.load_torch_file(ckpt_path, return_metadata=True)
+
+    manifest = _load_manifest(split_dir)
+    if components is not None and manifest is not None:
+        try:
+            return _read_components(split_dir, manifest, components)
+        except (OSError, ValueError, struct.error) as e:
+            logging.warning(f"SK Loader: component cache of {ckpt_path} unreadable, loading it whole: {e}")
+
+    sd, metadata = comfy.utils.load_torch_file(ckpt_path, return_metadata=True)
+    if manifest is None:
+        _write_split(ckpt_path, split_dir, fingerprint, sd, metadata)
+    return sd, metadata
+
+
+def _placeholder_tensors(path: str) -> dict:
+    """Shape/dtype-only (meta) tensors from a safetensors header, enough for model detection."""
+    import torch
+
+    with open(path, "rb") as f:
+        (header_len,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_len))
+    out = {}
+    for k, info in header.items():
+        if k == "__metadata__":
+            continue
+        dtype = getattr(torch, _SAFETENSORS_DTYPES.get(info["dtype"], "float32"))
+        out[k] = torch.empty(info["shape"], dtype=dtype, device="meta")
+    return out
+
+
+def _read_components(split_dir: str, manifest: dict, components: tuple) -> tuple[dict, dict | None]:
+    """Read the planned component files.
+
+    The UNet is always needed for model detection; when it is not requested it is
+    planned header-only and its tensors are meta placeholders read from the file header.
+    """
+    import comfy.utils
+
+    sd: dict = {}
+    for name, header_only in components:
+        path = os.path.join(split_dir, f"{name}.safetensors")
+        if header_only:
+            sd.update(_placeholder_tensors(path))
+        else:
+            sd.update(comfy.utils.load_torch_file(path))
+    return sd, manifest.get("metadata")
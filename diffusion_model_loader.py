@@ -4,6 +4,10 @@ from comfy_api.latest import ComfyExtension, io
 
 import folder_paths
 
+from .async_io import run_io
+from .dtype_cache import FP8_WEIGHT_DTYPES, cached_weight_path
+from .io_scheduler import get_io_scheduler
+from .shared_cache import get_shared_cache, make_key
 from .tree_utils import attach_tree_metadata, build_tree, list_files, resolve_selected_path
 
 
@@ -33,6 +37,11 @@ class UNETLoader(io.ComfyNode):
                     "weight_dtype",
                     options=["default", "fp8_e4m3fn", "fp8_e4m3fn_fast", "fp8_e5m2"],
                 ),
+                io.Boolean.Input(
+                    "cache_converted",
+                    default=False,
+                    tooltip="Keep an fp8 copy of the weights on disk and load it directly on later runs.",
+                ),
             ],
             outputs=[
                 io.Model.Output(),
@@ -40,9 +49,10 @@ class UNETLoader(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, unet: dict | str, weight_dtype: str) -> io.NodeOutput:
+    async def execute(cls, unet: dict | str, weight_dtype: str, cache_converted: bool = False) -> io.NodeOutput:
         import torch
         import comfy.sd
+        import comfy.utils
 
         model_options = {}
         if weight_dtype == "fp8_e4m3fn":
@@ -53,8 +63,27 @@ class UNETLoader(io.ComfyNode):
         elif weight_dtype == "fp8_e5m2":
             model_options["dtype"] = torch.float8_e5m2
 
-        unet_path = resolve_selected_path("diffusion_models", unet, "unet", "unet")
-        model = comfy.sd.load_diffusion_model(unet_path, model_options=model_options)
+        unet_path = await run_io(resolve_selected_path, "diffusion_models", unet, "unet", "unet")
+        if cache_converted:
+            src_path = unet_path
+            # Keyed by the stored dtype: fp8_e4m3fn and fp8_e4m3fn_fast share one converted file.
+            unet_path = await get_io_scheduler().schedule(
+                ("convert", src_path, FP8_WEIGHT_DTYPES.get(weight_dtype)),
+                src_path,
+                lambda: run_io(cached_weight_path, src_path, weight_dtype),
+            )
+
+        async def _load() -> tuple:
+            sd, metadata = await run_io(comfy.utils.load_torch_file, unet_path, return_metadata=True)
+            model = comfy.sd.load_diffusion_model_state_dict(sd, model_options=model_options, metadata=metadata)
+            if model is None:
+                raise RuntimeError(f"ERROR: Could not detect model type of: {unet_path}")
+            return (model,)
+
+        key = await run_io(make_key, "diffusion_model", unet_path, weight_dtype=weight_dtype)
+        (model,) = await get_shared_cache().aget_or_load(
+            key, lambda: get_io_scheduler().schedule(key, unet_path, _load)
+        )
         return io.NodeOutput(model)
 
 
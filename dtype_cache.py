@@ -0,0 +1,62 @@
+import logging
+import os
+
+from .cache_utils import atomic_save_torch_file, cache_entry_prefix, cache_root, file_fingerprint, remove_stale_entries
+
+# weight_dtype option -> torch dtype name stored in the converted file.
+FP8_WEIGHT_DTYPES = {
+    "fp8_e4m3fn": "float8_e4m3fn",
+    "fp8_e4m3fn_fast": "float8_e4m3fn",
+    "fp8_e5m2": "float8_e5m2",
+}
+
+
+# Bumped when the on-disk layout of converted files changes.
+CONVERTED_FORMAT = "v2"
+
+
+def _convert_state_dict(sd: dict, dtype, metadata: dict | None) -> dict:
+    """Return the diffusion model weights exactly as comfy keeps them for the given dtype.
+
+    Instead of guessing which tensors comfy stores in fp8, the model is built once
+    with ``model_options={"dtype": dtype}`` and its own state dict is saved, so
+    layers comfy keeps at higher precision keep their original values.
+    """
+    import comfy.sd
+
+    model = comfy.sd.load_diffusion_model_state_dict(sd, model_options={"dtype": dtype}, metadata=metadata)
+    if model is None:
+        raise RuntimeError("could not detect model type")
+    return {k: v.detach().to("cpu").contiguous() for k, v in model.model.diffusion_model.state_dict().items()}
+
+
+def cached_weight_path(src_path: str, weight_dtype: str) -> str:
+    """Return a pre-converted copy of src_path for the given weight_dtype, creating it on first use.
+
+    Files are keyed by source fingerprint and target dtype; unsupported modes, an
+    unusable cache directory or failed conversions fall back to the original path.
+    """
+    dtype_name = FP8_WEIGHT_DTYPES.get(weight_dtype)
+    if dtype_name is None:
+        return src_path
+
+    import torch
+    import comfy.utils
+
+    try:
+        fingerprint = file_fingerprint(src_path)
+        cache_dir = cache_root("fp8")
+        name = f"{cache_entry_prefix(src_path)}{fingerprint}.{dtype_name}.{CONVERTED_FORMAT}.safetensors"
+        target = os.path.join(cache_dir, name)
+        if os.path.exists(target):
+            return target
+        sd, metadata = comfy.utils.load_torch_file(src_path, return_metadata=True)
+        converted = _convert_state_dict(sd, getattr(torch, dtype_name), metadata)
+        del sd
+        atomic_save_torch_file(converted, target, metadata=metadata)
+        remove_stale_entries(cache_dir, src_path, fingerprint)
+    except Exception as e:
+        logging.warning(f"SK Loader: fp8 conversion of {src_path} failed, loading original: {e}")
+        return src_path
+    logging.info(f"SK Loader: cached {dtype_name} weights for {src_path} at {target}")
+    return target
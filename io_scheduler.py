@@ -0,0 +1,160 @@
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+from .async_io import run_io
+from .cache_utils import env_float
+
+# Maximum number of heavy loads running at once.
+MAX_READS_ENV = "SK_LOADER_MAX_CONCURRENT_READS"
+# Maximum bytes (MiB) of files being loaded at once; 0 means unlimited.
+MAX_READ_MB_ENV = "SK_LOADER_MAX_READ_MB"
+
+
+class IOScheduler:
+    """Extension-wide gate for SK loader file loads.
+
+    Loads run while both the concurrency and bytes-in-flight limits allow; queued
+    loads start smallest file first, so LoRAs and VAEs are not stuck behind
+    multi-GB checkpoints. A load that is larger than the byte limit still runs
+    once nothing else is in flight. Concurrent submissions with the same key share
+    a single load and its result.
+    """
+
+    def __init__(self, max_reads: int = 2, max_bytes: int = 0):
+        self.max_reads = max(1, max_reads)
+        self.max_bytes = max(0, max_bytes)
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._active = 0
+        self._active_bytes = 0
+        self._started = 0
+        self._completed = 0
+        self._dedup_hits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _fits(self, size: int) -> bool:
+        if self._active >= self.max_reads:
+            return False
+        if self.max_bytes and self._active and self._active_bytes + size > self.max_bytes:
+            return False
+        return True
+
+    def _grant(self, size: int) -> None:
+        self._active += 1
+        self._active_bytes += size
+
+    def _release(self, size: int) -> None:
+        self._active -= 1
+        self._active_bytes -= size
+        while self._waiters:
+            next_size, _, fut = self._waiters[0]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._fits(next_size):
+                break
+            heapq.heappop(self._waiters)
+            self._grant(next_size)
+            fut.set_result(None)
+
+    async def _acquire(self, size: int) -> None:
+        if not self._waiters and self._fits(size):
+            self._grant(size)
+            return
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (size, next(self._seq), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self._release(size)
+            raise
+
+    async def submit(self, key: Hashable, size: int, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func once a slot is free; concurrent calls with the same key share the result."""
+        existing = self._inflight.get(key)
+        if existing is not None:
+            self._dedup_hits += 1
+            return await asyncio.shield(existing)
+
+        shared = asyncio.get_running_loop().create_future()
+        # Mark exceptions as retrieved even if no duplicate caller awaited them.
+        shared.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = shared
+        try:
+            queued_at = time.monotonic()
+            await self._acquire(size)
+            waited = time.monotonic() - queued_at
+            self._started += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            try:
+                result = await func()
+            finally:
+                self._completed += 1
+                self._release(size)
+            shared.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            shared.cancel()
+            raise
+        except BaseException as e:
+            shared.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def schedule(self, key: Hashable, path: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """submit() with the priority/byte cost taken from the size of path."""
+        try:
+            size = await run_io(os.path.getsize, path)
+        except OSError:
+            size = 0
+        return await self.submit(key, size, func)
+
+    def metrics(self) -> dict[str, Any]:
+        queued = [w for w in self._waiters if not w[2].done()]
+        return {
+            "max_concurrent_reads": self.max_reads,
+            "max_bytes_in_flight": self.max_bytes,
+            "active": self._active,
+            "active_bytes": self._active_bytes,
+            "queue_depth": len(queued),
+            "queued_bytes": sum(w[0] for w in queued),
+            "completed": self._completed,
+            "dedup_hits": self._dedup_hits,
+            "wait_seconds_total": round(self._wait_total, 3),
+            "wait_seconds_avg": round(self._wait_total / self._started, 3) if self._started else 0.0,
+            "wait_seconds_max": round(self._wait_max, 3),
+        }
+
+
+_SCHEDULER = IOScheduler(
+    max_reads=int(env_float(MAX_READS_ENV, 2)),
+    max_bytes=int(env_float(MAX_READ_MB_ENV, 0) * 1024 * 1024),
+)
+
+
+def get_io_scheduler() -> IOScheduler:
+    return _SCHEDULER
+
+
+def register_routes() -> None:
+    """Expose GET /sk_loader/io_metrics on the ComfyUI server, if it is running."""
+    try:
+        from aiohttp import web
+        from server import PromptServer
+    except ImportError:
+        return
+    if getattr(PromptServer, "instance", None) is None:
+        return
+
+    @PromptServer.instance.routes.get("/sk_loader/io_metrics")
+    async def _io_metrics(request):
+        return web.json_response(get_io_scheduler().metrics())
@@ -1,7 +1,12 @@
+import asyncio
+import logging
+
 from typing_extensions import override
 
 from comfy_api.latest import ComfyExtension, io
 
+from .async_io import run_io
+from .io_scheduler import get_io_scheduler
 from .tree_utils import attach_tree_metadata, build_tree, list_files, resolve_selected_path
 
 
@@ -17,6 +22,15 @@ def build_file_input(input_id: str, folder_type: str, tooltip: str | None = None
     return attach_tree_metadata(combo, tree, tooltip=tooltip or "Select file")
 
 
+async def read_lora(lora_path: str) -> dict:
+    """Read a LoRA state dict through the shared I/O scheduler; concurrent reads of one file are merged."""
+    import comfy.utils
+
+    return await get_io_scheduler().schedule(
+        ("lora", lora_path), lora_path, lambda: run_io(comfy.utils.load_torch_file, lora_path, safe_load=True)
+    )
+
+
 def build_lora_slot_inputs(idx: int) -> list:
     """Return inputs for a single LoRA slot (enable + select + strengths)."""
     prefix = f"lora_{idx}"
@@ -81,20 +95,19 @@ class LoraLoader(io.ComfyNode):
         )
 
     @classmethod
-    def _apply_lora(cls, model, clip, selection: dict | str, strength_model: float, strength_clip: float):
+    async def _apply_lora(cls, model, clip, selection: dict | str, strength_model: float, strength_clip: float):
         import comfy.sd
-        import comfy.utils
 
         if strength_model == 0 and strength_clip == 0:
             return model, clip
 
-        lora_path = resolve_selected_path("loras", selection, "lora", "lora")
-        loaded = comfy.utils.load_torch_file(lora_path, safe_load=True)
+        lora_path = await run_io(resolve_selected_path, "loras", selection, "lora", "lora")
+        loaded = await read_lora(lora_path)
         return comfy.sd.load_lora_for_models(model, clip, loaded, strength_model, strength_clip)
 
     @classmethod
-    def execute(cls, model, clip, lora: dict | str, strength_model: float, strength_clip: float) -> io.NodeOutput:
-        model_lora, clip_lora = cls._apply_lora(model, clip, lora, strength_model, strength_clip)
+    async def execute(cls, model, clip, lora: dict | str, strength_model: float, strength_clip: float) -> io.NodeOutput:
+        model_lora, clip_lora = await cls._apply_lora(model, clip, lora, strength_model, strength_clip)
         return io.NodeOutput(model_lora, clip_lora)
 
 
@@ -124,8 +137,8 @@ class LoraLoaderModelOnly(LoraLoader):
         )
 
     @classmethod
-    def execute(cls, model, lora: dict | str, strength_model: float) -> io.NodeOutput:
-        model_lora, _ = cls._apply_lora(model, None, lora, strength_model, 0)
+    async def execute(cls, model, lora: dict | str, strength_model: float) -> io.NodeOutput:
+        model_lora, _ = await cls._apply_lora(model, None, lora, strength_model, 0)
         return io.NodeOutput(model_lora)
 
 
@@ -154,12 +167,12 @@ class PowerLoraLoader(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, model, clip, **kwargs) -> io.NodeOutput:
+    async def execute(cls, model, clip, **kwargs) -> io.NodeOutput:
         import comfy.sd
-        import comfy.utils
 
         model_out, clip_out = model, clip
 
+        slots: list[tuple[str, float, float]] = []
         for idx in range(1, cls.NUM_SLOTS + 1):
             enabled = kwargs.get(f"lora_{idx}_enabled", False)
             if not enabled:
@@ -175,11 +188,17 @@ class PowerLoraLoader(io.ComfyNode):
                 continue
 
             try:
-                lora_path = resolve_selected_path("loras", selection, f"lora_{idx}", f"lora_{idx}")
+                lora_path = await run_io(resolve_selected_path, "loras", selection, f"lora_{idx}", f"lora_{idx}")
             except FileNotFoundError:
+                logging.warning(f"SK Loader: skipping LoRA slot {idx}, selection not found: {selection}")
                 continue
+            slots.append((lora_path, strength_model, strength_clip))
 
-            loaded = comfy.utils.load_torch_file(lora_path, safe_load=True)
+        # Read every enabled LoRA concurrently, then patch in slot order.
+        loaded_all = await asyncio.gather(
+            *(read_lora(lora_path) for lora_path, _, _ in slots)
+        )
+        for (_, strength_model, strength_clip), loaded in zip(slots, loaded_all):
             model_out, clip_out = comfy.sd.load_lora_for_models(
                 model_out,
                 clip_out,
@@ -191,6 +210,99 @@ class PowerLoraLoader(io.ComfyNode):
         return io.NodeOutput(model_out, clip_out)
 
 
+def parse_strengths(text: str) -> list[float]:
+    """Parse a comma/whitespace separated list of strengths, e.g. "0.5, 0.75, 1.0"."""
+    values = [float(part) for part in text.replace(",", " ").split()]
+    if not values:
+        raise ValueError("No strengths given")
+    return values
+
+
+class LoraSweep(io.ComfyNode):
+    CATEGORY = "SK Loader"
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="SK_LoraSweep",
+            display_name="[SK] LoRA Sweep",
+            category="SK Loader",
+            inputs=[
+                io.Model.Input("model", tooltip="The diffusion model the LoRA will be applied to."),
+                io.Clip.Input("clip", tooltip="The CLIP model the LoRA will be applied to."),
+                build_file_input("lora", "loras", tooltip="The name of the LoRA."),
+                io.String.Input(
+                    "strengths_model",
+                    default="0.5, 0.75, 1.0",
+                    tooltip="Comma separated model strengths, one output per value.",
+                ),
+                io.String.Input(
+                    "strengths_clip",
+                    default="",
+                    tooltip="Comma separated CLIP strengths. A single value applies to every output; empty reuses the model strengths.",
+                ),
+            ],
+            outputs=[
+                io.Model.Output(tooltip="One patched diffusion model per strength.", is_output_list=True),
+                io.Clip.Output(tooltip="One patched CLIP model per strength.", is_output_list=True),
+            ],
+            description="Load a LoRA once and apply it at several strengths for A/B grids. Every output shares the same LoRA weights; only the patch metadata is duplicated.",
+        )
+
+    @classmethod
+    async def execute(cls, model, clip, lora: dict | str, strengths_model: str, strengths_clip: str) -> io.NodeOutput:
+        import comfy.lora
+        import comfy.lora_convert
+
+        model_strengths = parse_strengths(strengths_model)
+        clip_strengths = parse_strengths(strengths_clip) if strengths_clip.strip() else list(model_strengths)
+        if len(clip_strengths) == 1:
+            clip_strengths = clip_strengths * len(model_strengths)
+        if len(clip_strengths) != len(model_strengths):
+            raise ValueError(
+                f"strengths_clip has {len(clip_strengths)} values but strengths_model has {len(model_strengths)}"
+            )
+
+        lora_path = await run_io(resolve_selected_path, "loras", lora, "lora", "lora")
+        lora_sd = await read_lora(lora_path)
+
+        # Map and parse the LoRA once; each clone only records references to these patches.
+        key_map: dict = {}
+        key_map = comfy.lora.model_lora_keys_unet(model.model, key_map)
+        if clip is not None:
+            key_map = comfy.lora.model_lora_keys_clip(clip.cond_stage_model, key_map)
+        patches = comfy.lora.load_lora(comfy.lora_convert.convert_lora(lora_sd), key_map)
+
+        models_out = []
+        clips_out = []
+        model_keys: set | None = None
+        clip_keys: set | None = None
+        for strength_model, strength_clip in zip(model_strengths, clip_strengths):
+            model_out = model
+            if strength_model != 0:
+                model_out = model.clone()
+                model_keys = set(model_out.add_patches(patches, strength_model))
+            clip_out = clip
+            if clip is not None and strength_clip != 0:
+                clip_out = clip.clone()
+                clip_keys = set(clip_out.add_patches(patches, strength_clip))
+            models_out.append(model_out)
+            clips_out.append(clip_out)
+
+        # Same check as comfy.sd.load_lora_for_models; the consumed keys do not depend on strength.
+        if model_keys is not None or clip_keys is not None:
+            if model_keys is None:
+                model_keys = set(model.clone().add_patches(patches, 0))
+            if clip_keys is None and clip is not None:
+                clip_keys = set(clip.clone().add_patches(patches, 0))
+            consumed = model_keys | (clip_keys or set())
+            for x in patches:
+                if x not in consumed:
+                    logging.warning("NOT LOADED {}".format(x))
+
+        return io.NodeOutput(models_out, clips_out)
+
+
 class LoraExtension(ComfyExtension):
     @override
     async def get_node_list(self) -> list[type[io.ComfyNode]]:
@@ -198,6 +310,7 @@ class LoraExtension(ComfyExtension):
             LoraLoader,
             LoraLoaderModelOnly,
             PowerLoraLoader,
+            LoraSweep,
         ]
 
 
@@ -0,0 +1,180 @@
+import logging
+import os
+import re
+from typing import Any
+
+import folder_paths
+
+from .async_io import run_io
+from .lora_loader import PowerLoraLoader
+from .tree_utils import list_files, resolve_selected_path
+from .vae_loader import BUILTIN_VAES, resolve_selected_path as resolve_vae_path
+
+# Widget order of every SK node, as serialized in UI workflow "widgets_values".
+NODE_WIDGETS: dict[str, tuple[str, ...]] = {
+    "SK_CheckpointLoader": ("config_name", "ckpt"),
+    "SK_CheckpointLoaderSimple": ("ckpt",),
+    "SK_unCLIPCheckpointLoader": ("ckpt",),
+    "SK_CheckpointComponentLoader": ("ckpt", "load_model", "load_clip", "load_vae"),
+    "SK_UNETLoader": ("unet", "weight_dtype", "cache_converted"),
+    "SK_LoraLoader": ("lora", "strength_model", "strength_clip"),
+    "SK_LoraLoaderModelOnly": ("lora", "strength_model"),
+    "SK_LoraSweep": ("lora", "strengths_model", "strengths_clip"),
+    "SK_PowerLoraLoader": tuple(
+        name
+        for idx in range(1, PowerLoraLoader.NUM_SLOTS + 1)
+        for name in (f"lora_{idx}_enabled", f"lora_{idx}", f"lora_{idx}_strength_model", f"lora_{idx}_strength_clip")
+    ),
+    "SK_VAELoader": ("vae",),
+}
+
+# Selection inputs -> folder type they resolve against.
+SELECTION_INPUTS = {
+    "config_name": "configs",
+    "ckpt": "checkpoints",
+    "unet": "diffusion_models",
+    "lora": "loras",
+    "vae": "vae",
+}
+_POWER_LORA_RE = re.compile(r"^lora_(\d+)$")
+
+# UI workflow node modes that never execute (bypass=4, never/muted=2).
+SKIPPED_NODE_MODES = (2, 4)
+
+
+def _is_zero(value: Any) -> bool:
+    """True for a literal zero strength; linked or unparsable values count as non-zero."""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        return False
+    try:
+        return float(value) == 0
+    except ValueError:
+        return False
+
+
+def _selection_inputs(class_type: str, inputs: dict[str, Any]) -> list[tuple[str, str]]:
+    """(input name, folder type) pairs that the node would resolve when executed.
+
+    Mirrors the early returns in the loaders: LoRAs at zero strength and disabled
+    PowerLoraLoader slots are never resolved, so they are not checked here either.
+    """
+    if class_type in ("SK_LoraLoader", "SK_LoraLoaderModelOnly"):
+        strength_clip = inputs.get("strength_clip", 0) if class_type == "SK_LoraLoader" else 0
+        if _is_zero(inputs.get("strength_model", 1.0)) and _is_zero(strength_clip):
+            return []
+    out = []
+    for name in NODE_WIDGETS.get(class_type, ()):
+        if name in SELECTION_INPUTS:
+            out.append((name, SELECTION_INPUTS[name]))
+        elif _POWER_LORA_RE.match(name):
+            if not inputs.get(f"{name}_enabled") or not isinstance(inputs.get(name), (dict, str)):
+                continue
+            if _is_zero(inputs.get(f"{name}_strength_model", 1.0)) and _is_zero(inputs.get(f"{name}_strength_clip", 1.0)):
+                continue
+            out.append((name, "loras"))
+    return out
+
+
+def _iter_nodes(body: dict[str, Any]):
+    """Yield (node id, class_type, inputs) from an API prompt or a UI workflow."""
+    if isinstance(body.get("prompt"), dict):
+        body = body["prompt"]
+    elif isinstance(body.get("workflow"), dict):
+        body = body["workflow"]
+
+    if isinstance(body.get("nodes"), list):
+        for node in body["nodes"]:
+            class_type = node.get("type")
+            values = node.get("widgets_values")
+            if class_type not in NODE_WIDGETS or not isinstance(values, list):
+                continue
+            if node.get("mode") in SKIPPED_NODE_MODES:
+                continue
+            yield str(node.get("id")), class_type, dict(zip(NODE_WIDGETS[class_type], values))
+        return
+
+    for node_id, node in body.items():
+        if isinstance(node, dict) and node.get("class_type") in NODE_WIDGETS:
+            yield str(node_id), node["class_type"], node.get("inputs") or {}
+
+
+def _resolve_one(folder_type: str, input_name: str, selection: Any, listings: dict[str, set[str]]) -> str | None:
+    if folder_type == "configs":
+        return folder_paths.get_full_path("configs", selection) if isinstance(selection, str) else None
+    if folder_type == "vae":
+        try:
+            path = resolve_vae_path(selection, "vae_folder", "vae_name")
+        except ValueError:
+            return None
+        return path if path in BUILTIN_VAES or os.path.exists(path) else None
+
+    if isinstance(selection, str) and not os.path.isabs(selection):
+        # The shared index is only a fast positive check: ignored folders and files added
+        # within the index TTL still resolve at execution, so a miss falls through to disk.
+        if folder_type not in listings:
+            listings[folder_type] = set(list_files(folder_type, ""))
+        rel = selection.strip().replace("\\", "/")
+        rel_no_prefix = rel[len(folder_type) + 1 :] if rel.startswith(f"{folder_type}/") else rel
+        for candidate_rel in (rel_no_prefix, rel):
+            if candidate_rel not in listings[folder_type]:
+                continue
+            for base in folder_paths.get_folder_paths(folder_type):
+                candidate = os.path.join(base, candidate_rel)
+                if os.path.isfile(candidate):
+                    return candidate
+    try:
+        path = resolve_selected_path(folder_type, selection, input_name, input_name)
+    except (FileNotFoundError, ValueError):
+        return None
+    return path if os.path.exists(path) else None
+
+
+def resolve_prompt_selections(body: dict[str, Any]) -> dict[str, Any]:
+    """Resolve every SK loader selection in a prompt/workflow in one pass.
+
+    Returns resolved paths with file sizes and the selections that would fail at execution.
+    """
+    listings: dict[str, set[str]] = {}
+    resolved: list[dict[str, Any]] = []
+    missing: list[dict[str, Any]] = []
+    for node_id, class_type, inputs in _iter_nodes(body):
+        for input_name, folder_type in _selection_inputs(class_type, inputs):
+            selection = inputs.get(input_name)
+            entry = {"node": node_id, "class_type": class_type, "input": input_name, "selection": selection}
+            if isinstance(selection, list):
+                # Linked input in an API prompt; only known once the graph runs.
+                continue
+            path = _resolve_one(folder_type, input_name, selection, listings)
+            if path is None:
+                missing.append(entry)
+                continue
+            entry["path"] = path
+            entry["size"] = os.path.getsize(path) if os.path.isfile(path) else None
+            resolved.append(entry)
+    return {"ok": not missing, "resolved": resolved, "missing": missing}
+
+
+def register_routes() -> None:
+    """Expose POST /sk_loader/resolve on the ComfyUI server, if it is running."""
+    try:
+        from aiohttp import web
+        from server import PromptServer
+    except ImportError:
+        return
+    if getattr(PromptServer, "instance", None) is None:
+        return
+
+    @PromptServer.instance.routes.post("/sk_loader/resolve")
+    async def _resolve(request):
+        try:
+            body = await request.json()
+        except ValueError:
+            return web.json_response({"error": "Invalid JSON body"}, status=400)
+        if not isinstance(body, dict):
+            return web.json_response({"error": "Expected a prompt or workflow object"}, status=400)
+        try:
+            result = await run_io(resolve_prompt_selections, body)
+        except Exception as e:
+            logging.exception("SK Loader: selection resolution failed")
+            return web.json_response({"error": str(e)}, status=500)
+        return web.json_response(result)
@@ -0,0 +1,174 @@
+import asyncio
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from .cache_utils import env_float, file_fingerprint
+
+# RAM budget (MiB) for idle entries kept alive by the cache itself. Pinned entries are
+# dropped whenever ComfyUI unloads all models (e.g. "Free model and node cache", POST /free)
+# and on POST /sk_loader/free_cache.
+BUDGET_ENV = "SK_LOADER_SHARED_CACHE_MB"
+
+
+def _estimate_size(obj: Any) -> int:
+    """Best-effort byte size of a MODEL/CLIP/VAE/CLIP_VISION object."""
+    if obj is None:
+        return 0
+    for target in (obj, getattr(obj, "patcher", None)):
+        size_fn = getattr(target, "model_size", None)
+        if callable(size_fn):
+            try:
+                return int(size_fn())
+            except Exception:
+                pass
+    return 0
+
+
+def _ref(obj: Any):
+    if obj is None:
+        return lambda: None
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return lambda: obj
+
+
+class SharedModelCache:
+    """Process-wide registry of loaded model objects shared by every SK loader node.
+
+    Entries stay shared for as long as anything (a node output, another workflow)
+    still references them; Python's reference counting is tracked through weak
+    references. On top of that, the most recently used entries are pinned with
+    strong references up to ``budget_bytes`` and evicted in LRU order.
+    """
+
+    def __init__(self, budget_bytes: int = 0):
+        self.budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        self._live: dict[Hashable, tuple] = {}
+        self._pinned: OrderedDict[Hashable, tuple[tuple, int]] = OrderedDict()
+        self._pinned_bytes = 0
+        self._pending: dict[Hashable, asyncio.Future] = {}
+
+    def get(self, key: Hashable) -> tuple | None:
+        with self._lock:
+            refs = self._live.get(key)
+            if refs is None:
+                return None
+            values = tuple(r() for r in refs[1])
+            if any(v is None for v, orig_none in zip(values, refs[0]) if not orig_none):
+                del self._live[key]
+                return None
+            if key in self._pinned:
+                self._pinned.move_to_end(key)
+            else:
+                self._pin(key, values)
+            return values
+
+    def put(self, key: Hashable, values: tuple) -> tuple:
+        values = tuple(values)
+        with self._lock:
+            self._live[key] = (tuple(v is None for v in values), tuple(_ref(v) for v in values))
+            self._pin(key, values)
+        return values
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], tuple]) -> tuple:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        return self.put(key, loader())
+
+    async def aget_or_load(self, key: Hashable, loader: Callable[[], Awaitable[tuple]]) -> tuple:
+        """get_or_load for async loaders; concurrent misses on one key share a single load."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        shared = asyncio.get_running_loop().create_future()
+        # Mark exceptions as retrieved even if no concurrent caller awaited them.
+        shared.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._pending[key] = shared
+        try:
+            values = self.put(key, await loader())
+            shared.set_result(values)
+            return values
+        except asyncio.CancelledError:
+            shared.cancel()
+            raise
+        except BaseException as e:
+            shared.set_exception(e)
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every entry; objects still referenced elsewhere stay alive but are no longer shared."""
+        with self._lock:
+            self._live.clear()
+            self._pinned.clear()
+            self._pinned_bytes = 0
+
+    def _pin(self, key: Hashable, values: tuple) -> None:
+        old = self._pinned.pop(key, None)
+        if old is not None:
+            self._pinned_bytes -= old[1]
+        size = sum(_estimate_size(v) for v in values)
+        self._pinned[key] = (values, size)
+        self._pinned_bytes += size
+        while self._pinned and self._pinned_bytes > self.budget_bytes:
+            _, (_, evicted) = self._pinned.popitem(last=False)
+            self._pinned_bytes -= evicted
+        self._live = {k: v for k, v in self._live.items() if k in self._pinned or any(r() is not None for r in v[1])}
+
+
+def make_key(kind: str, path: str, **options: Any) -> tuple:
+    """Cache key from resolved path, file identity and load options."""
+    real = os.path.realpath(path)
+    return (kind, real, file_fingerprint(real), tuple(sorted(options.items())))
+
+
+_CACHE = SharedModelCache(int(env_float(BUDGET_ENV, 0) * 1024 * 1024))
+
+
+def get_shared_cache() -> SharedModelCache:
+    return _CACHE
+
+
+def hook_model_unload() -> None:
+    """Clear the shared cache whenever ComfyUI unloads all models, so /free also releases pinned entries."""
+    try:
+        import comfy.model_management
+    except ImportError:
+        return
+    original = comfy.model_management.unload_all_models
+    if getattr(original, "_sk_loader_hooked", False):
+        return
+
+    def unload_all_models(*args, **kwargs):
+        get_shared_cache().clear()
+        return original(*args, **kwargs)
+
+    unload_all_models._sk_loader_hooked = True
+    comfy.model_management.unload_all_models = unload_all_models
+
+
+def register_routes() -> None:
+    """Expose POST /sk_loader/free_cache on the ComfyUI server, if it is running."""
+    try:
+        from aiohttp import web
+        from server import PromptServer
+    except ImportError:
+        return
+    if getattr(PromptServer, "instance", None) is None:
+        return
+
+    @PromptServer.instance.routes.post("/sk_loader/free_cache")
+    async def _free_cache(request):
+        get_shared_cache().clear()
+        return web.json_response({"ok": True})
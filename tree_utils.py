@@ -1,26 +1,331 @@
+import base64
+import contextlib
+import fnmatch
+import gzip
+import hashlib
 import json
+import logging
 import os
-from typing import Any, Iterable
+import threading
+import time
+from typing import Any, Iterable, Iterator
 
 import folder_paths
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+from .cache_utils import cache_root, env_float
+
 
 # File extensions we consider as model artifacts for the loaders.
 ALLOWED_EXT = {".safetensors", ".ckpt", ".bin", ".pt", ".pth"}
 
+# Per-folder-type extension sets; folder types not listed use ALLOWED_EXT. Each is a
+# superset of ALLOWED_EXT so saved selections stay valid; narrow a type via scan rules.
+FOLDER_TYPE_EXT: dict[str, set[str]] = {
+    "checkpoints": ALLOWED_EXT | {".sft"},
+    "diffusion_models": ALLOWED_EXT | {".sft"},
+    "loras": ALLOWED_EXT | {".sft"},
+    "vae": ALLOWED_EXT | {".sft"},
+}
+
+# Optional JSON file with user scan rules (not shipped; create it to customize scans),
+# keyed by folder type or "*" for all types:
+# {"loras": {"extensions": [".safetensors"], "ignore": [".*", "old"]}}.
+# Each given field replaces the default for that folder type.
+SCAN_RULES_ENV = "SK_LOADER_SCAN_RULES"
+SCAN_RULES_FILE = os.path.join(os.path.dirname(__file__), "scan_rules.json")
+
+# Directory/file globs never descended into or listed, for every folder type.
+DEFAULT_IGNORE = [".*", "__pycache__", "node_modules", "previews", "thumbnails"]
+
+# Per-directory ignore file; its globs apply to that directory and everything below it.
+SKIGNORE_NAME = ".skignore"
+
+# Seconds a folder index stays fresh before one process rescans it; 0 disables the shared index.
+# Enabled by default: each scanned folder gets an index/*.json and *.lock file under the cache
+# root (models_dir/.sk_cache or SK_LOADER_CACHE_DIR). Set it to 0 to keep the model store untouched.
+INDEX_TTL_ENV = "SK_LOADER_INDEX_TTL"
+DEFAULT_INDEX_TTL = 10.0
+
 # Sentinel marker to tuck tree JSON into tooltips as a fallback transport.
 TREE_SENTINEL = "[[SK_TREE::"
 
+# Version tag of the compact tree wire format (see encode_tree_compact).
+COMPACT_TREE_VERSION = 1
+
+# Set to gzip+base64 the compact tree payload; the frontend inflates it lazily.
+TREE_GZIP_ENV = "SK_LOADER_TREE_GZIP"
+
+
+class ScanRules:
+    """Extension set and ignore globs applied while walking one folder type."""
+
+    def __init__(self, extensions: Iterable[str] | None = None, ignore: Iterable[str] | None = None):
+        self.extensions = {e.lower() for e in (extensions if extensions is not None else ALLOWED_EXT)}
+        self.ignore = list(ignore if ignore is not None else DEFAULT_IGNORE)
+
+    def accepts_file(self, fname: str) -> bool:
+        return os.path.splitext(fname.lower())[1] in self.extensions
+
+
+_SCAN_RULES: dict[str, ScanRules] = {}
+_RULES_CONFIG: dict[str, Any] | None = None
+
+
+def _rules_config() -> dict[str, Any]:
+    """Load the user scan rules file once; a missing file means defaults, a broken one is logged."""
+    global _RULES_CONFIG
+    if _RULES_CONFIG is None:
+        path = os.environ.get(SCAN_RULES_ENV) or SCAN_RULES_FILE
+        _RULES_CONFIG = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                _RULES_CONFIG = data
+            else:
+                logging.warning(f"SK Loader: ignoring scan rules in {path}, expected a JSON object")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning(f"SK Loader: could not read scan rules from {path}: {e}")
+    return _RULES_CONFIG
+
+
+def register_scan_rules(folder_type: str, extensions: Iterable[str] | None = None, ignore: Iterable[str] | None = None) -> ScanRules:
+    """Override the extensions and/or ignore globs used when scanning a folder type."""
+    rules = ScanRules(extensions, ignore)
+    _SCAN_RULES[folder_type] = rules
+    return rules
+
+
+def get_scan_rules(folder_type: str) -> ScanRules:
+    """Rules for a folder type: register_scan_rules() overrides, then the rules file, then defaults."""
+    rules = _SCAN_RULES.get(folder_type)
+    if rules is not None:
+        return rules
+    config = _rules_config()
+    merged: dict[str, Any] = {}
+    for section in (config.get("*"), config.get(folder_type)):
+        if isinstance(section, dict):
+            merged.update({k: v for k, v in section.items() if k in ("extensions", "ignore") and isinstance(v, list)})
+    rules = ScanRules(merged.get("extensions", FOLDER_TYPE_EXT.get(folder_type)), merged.get("ignore"))
+    _SCAN_RULES[folder_type] = rules
+    return rules
+
+
+def _read_skignore(dir_path: str, anchor: str) -> list[tuple[str, str]]:
+    """Read (anchor, glob) pairs from a .skignore file; '#' starts a comment."""
+    try:
+        with open(os.path.join(dir_path, SKIGNORE_NAME), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    patterns = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip().strip("/")
+        if line:
+            patterns.append((anchor, line))
+    return patterns
+
+
+def _is_ignored(rel_path: str, name: str, patterns: list[tuple[str, str]]) -> bool:
+    for anchor, pat in patterns:
+        sub = rel_path[len(anchor) + 1 :] if anchor and rel_path.startswith(f"{anchor}/") else rel_path
+        if fnmatch.fnmatch(name, pat) or fnmatch.fnmatch(sub, pat):
+            return True
+    return False
+
+
+def walk_model_files(folder_type: str, base: str, rel_dir: str = "") -> Iterator[tuple[str, list[str], list[str]]]:
+    """Walk a folder-type root like os.walk, yielding (rel_root, subdirs, model_files).
+
+    Ignored directories are pruned before descending, so their contents are never read;
+    .skignore files found along the way extend the ignore globs for their subtree.
+    """
+    rules = get_scan_rules(folder_type)
+    rel_dir = rel_dir.replace("\\", "/").strip("/")
+    start = os.path.join(base, rel_dir) if rel_dir else base
+    if not os.path.isdir(start):
+        return
+
+    inherited: list[tuple[str, str]] = [("", pat) for pat in rules.ignore]
+    parts = rel_dir.split("/") if rel_dir else []
+    for depth in range(len(parts)):
+        anchor = "/".join(parts[:depth])
+        inherited += _read_skignore(os.path.join(base, anchor) if anchor else base, anchor)
+    patterns_by_dir: dict[str, list[tuple[str, str]]] = {rel_dir: inherited}
+
+    for root, subdirs, fnames in os.walk(start):
+        rel_root = os.path.relpath(root, base)
+        rel_root = "" if rel_root in (".", "") else rel_root.replace("\\", "/")
+        patterns = patterns_by_dir.pop(rel_root, inherited)
+        if SKIGNORE_NAME in fnames:
+            patterns = patterns + _read_skignore(root, rel_root)
+
+        kept_dirs = []
+        for d in subdirs:
+            rel = f"{rel_root}/{d}" if rel_root else d
+            if _is_ignored(rel, d, patterns):
+                continue
+            kept_dirs.append(d)
+            patterns_by_dir[rel] = patterns
+        subdirs[:] = kept_dirs
+
+        files = [
+            f
+            for f in fnames
+            if rules.accepts_file(f) and not _is_ignored(f"{rel_root}/{f}" if rel_root else f, f, patterns)
+        ]
+        yield rel_root, list(kept_dirs), files
+
+
+@contextlib.contextmanager
+def _exclusive_lock(lock_path: str):
+    """Cross-process exclusive lock on a side file (fcntl/msvcrt, no-op elsewhere)."""
+    with open(lock_path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+_INDEX_MEMO: dict[tuple[str, str], tuple[float, list]] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+_INDEX_WARNED = False
+
+
+def _index_ttl() -> float:
+    return env_float(INDEX_TTL_ENV, DEFAULT_INDEX_TTL)
+
+
+def _warn_index_unavailable(err: OSError) -> None:
+    global _INDEX_WARNED
+    if not _INDEX_WARNED:
+        _INDEX_WARNED = True
+        logging.warning(f"SK Loader: shared folder index unavailable, scanning per process: {err}")
+
+
+def _read_index_file(path: str, signature: list, ttl: float) -> tuple[float, list] | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # The file is shared with other processes (and possibly other extension versions):
+    # anything not shaped like our index is treated as stale and rescanned.
+    if not isinstance(data, dict):
+        return None
+    stamp, entries = data.get("time"), data.get("entries")
+    if isinstance(stamp, bool) or not isinstance(stamp, (int, float)) or not isinstance(entries, list):
+        return None
+    if not all(
+        isinstance(e, list) and len(e) == 3 and isinstance(e[0], str) and isinstance(e[1], list) and isinstance(e[2], list)
+        for e in entries
+    ):
+        return None
+    if data.get("signature") != signature or time.time() - stamp > ttl:
+        return None
+    return stamp, entries
+
+
+def _shared_index(folder_type: str, base: str, ttl: float) -> tuple[float, list]:
+    """Read the shared index, refreshing it under the lock when stale.
+
+    Raises OSError when the cache directory or lock file cannot be used; a failed
+    write after a successful walk still returns the fresh entries.
+    """
+    rules = get_scan_rules(folder_type)
+    signature = [folder_type, os.path.abspath(base), sorted(rules.extensions), rules.ignore]
+    name = hashlib.sha1(json.dumps(signature).encode("utf-8")).hexdigest()[:16]
+    index_path = os.path.join(cache_root("index"), f"{name}.json")
+
+    found = _read_index_file(index_path, signature, ttl)
+    if found is not None:
+        return found
+    with _exclusive_lock(f"{index_path}.lock"):
+        found = _read_index_file(index_path, signature, ttl)
+        if found is not None:
+            return found
+        entries = [list(e) for e in walk_model_files(folder_type, base)]
+        found = (time.time(), entries)
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"signature": signature, "time": found[0], "entries": entries}, f, separators=(",", ":"))
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            _warn_index_unavailable(e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return found
+
+
+def scan_folder(folder_type: str, base: str, rel_dir: str = "") -> list:
+    """Return walk_model_files(folder_type, base, rel_dir) entries, served from the shared folder index.
+
+    The index is a JSON file under the SK cache directory shared by every ComfyUI
+    process on the host; it is on by default (SK_LOADER_INDEX_TTL=10). Readers use it while it is younger than SK_LOADER_INDEX_TTL;
+    when it is stale, one process rescans under an exclusive file lock and atomically
+    replaces it while the others wait and then read the fresh copy. With a TTL of 0,
+    or when the cache directory is unusable (e.g. a read-only model store), the
+    folder is walked directly.
+    """
+    rel_dir = rel_dir.replace("\\", "/").strip("/")
+    ttl = _index_ttl()
+    if ttl <= 0:
+        return list(walk_model_files(folder_type, base, rel_dir))
+
+    memo_key = (folder_type, base)
+    with _INDEX_LOCK:
+        memo = _INDEX_MEMO.get(memo_key)
+    if memo is not None and time.time() - memo[0] <= ttl:
+        found = memo
+    else:
+        try:
+            found = _shared_index(folder_type, base, ttl)
+        except OSError as e:
+            _warn_index_unavailable(e)
+            return list(walk_model_files(folder_type, base, rel_dir))
+        with _INDEX_LOCK:
+            _INDEX_MEMO[memo_key] = found
+
+    if not rel_dir:
+        return found[1]
+    return [e for e in found[1] if e[0] == rel_dir or e[0].startswith(f"{rel_dir}/")]
+
 
 def list_dirs(folder_type: str) -> list[str]:
     """Return all subdirectories (relative) under the registered folder type."""
     dirs = set([""])
     for base in folder_paths.get_folder_paths(folder_type):
-        for root, subdirs, _ in os.walk(base):
+        for rel_root, subdirs, _ in scan_folder(folder_type, base):
             for d in subdirs:
-                rel = os.path.relpath(os.path.join(root, d), base)
-                rel = rel.replace("\\", "/")
-                dirs.add(rel)
+                dirs.add(f"{rel_root}/{d}" if rel_root else d)
     return sorted(dirs)
 
 
@@ -28,18 +333,9 @@ def list_files(folder_type: str, rel_dir: str) -> list[str]:
     """Return files under a relative directory for the given folder type."""
     files: list[str] = []
     for base in folder_paths.get_folder_paths(folder_type):
-        dir_path = os.path.join(base, rel_dir) if rel_dir else base
-        if not os.path.isdir(dir_path):
-            continue
-        for root, _, fnames in os.walk(dir_path):
+        for rel_root, _, fnames in scan_folder(folder_type, base, rel_dir):
             for f in fnames:
-                name_low = f.lower()
-                ext = os.path.splitext(name_low)[1]
-                if ext not in ALLOWED_EXT:
-                    continue
-                rel = os.path.relpath(os.path.join(root, f), dir_path)
-                rel = rel.replace("\\", "/")
-                files.append(rel if rel_dir == "" else os.path.join(rel_dir, rel).replace("\\", "/"))
+                files.append(f"{rel_root}/{f}" if rel_root else f)
     return sorted(set(files))
 
 
@@ -70,18 +366,10 @@ def build_tree(folder_type: str, file_id: str, extra_roots: list[dict[str, Any]]
         base_label = os.path.basename(base) or folder_type
         base_node: dict[str, Any] = {"label": base_label, "value": None, "children": []}
 
-        for root, _, fnames in os.walk(base):
-            rel_root = os.path.relpath(root, base)
-            if rel_root in (".", ""):
-                rel_root = ""
-            rel_root = rel_root.replace("\\", "/")
-
+        for rel_root, _, fnames in scan_folder(folder_type, base):
             target_children = _ensure_branch(base_node["children"], rel_root.split("/"))
 
             for fname in fnames:
-                ext = os.path.splitext(fname.lower())[1]
-                if ext not in ALLOWED_EXT:
-                    continue
                 rel_path = fname if rel_root == "" else f"{rel_root}/{fname}"
                 folder_val = rel_root if rel_root else "root"
                 child_id = f"{file_id}__{sanitize_rel_dir(rel_root)}"
@@ -168,10 +456,49 @@ def resolve_selected_path(folder_type: str, selection: dict | str, folder_id: st
     raise FileNotFoundError(f"Could not resolve path for selection: {rel_path}")
 
 
+def encode_tree_compact(tree: list[dict[str, Any]]) -> dict[str, Any]:
+    """Encode a tree into the compact wire format decoded by web/comfyui_sk_loader.js.
+
+    Leaf values are interned into a group table ``g`` of ``[folder, child_id, file_prefix]``
+    entries, so a leaf is just ``[label, group_index]`` and its file is ``file_prefix + label``.
+    Folders are ``[label, [children...]]``; leaves whose value does not fit a group keep
+    their value object as ``[label, {...}]``.
+    """
+    groups: list[list[str]] = []
+    group_index: dict[tuple[str, str, str], int] = {}
+
+    def _encode(node: dict[str, Any]) -> list[Any]:
+        label = node.get("label", "")
+        children = node.get("children") or []
+        value = node.get("value")
+        if children or value is None:
+            return [label, [_encode(c) for c in children]]
+        if isinstance(value, dict) and set(value) == {"folder", "file", "child_id"} and value["file"].endswith(label):
+            file = value["file"]
+            key = (value["folder"], value["child_id"], file[: len(file) - len(label)])
+            idx = group_index.get(key)
+            if idx is None:
+                idx = group_index[key] = len(groups)
+                groups.append(list(key))
+            return [label, idx]
+        return [label, value]
+
+    nodes = [_encode(n) for n in tree]
+    return {"sk": COMPACT_TREE_VERSION, "g": groups, "t": nodes}
+
+
+def serialize_tree(tree: list[dict[str, Any]]) -> str:
+    """Serialize a tree for transport: compact JSON, optionally gzip+base64 prefixed with ``gz:``."""
+    encoded = json.dumps(encode_tree_compact(tree), separators=(",", ":"))
+    if os.environ.get(TREE_GZIP_ENV, "") not in ("", "0"):
+        return "gz:" + base64.b64encode(gzip.compress(encoded.encode("utf-8"))).decode("ascii")
+    return encoded
+
+
 def attach_tree_metadata(input_obj: Any, tree: list[dict[str, Any]], tooltip: str | None = None) -> Any:
     """Attach tree data to the input in several ways so the frontend can pick it up."""
     tooltip = tooltip or "Select folder"
-    encoded = json.dumps(tree, separators=(",", ":"))
+    encoded = serialize_tree(tree)
     sentinel = f"{TREE_SENTINEL}{encoded}]]"
     try:
         # Keep the human tooltip on the first line, stash tree data after sentinel.
@@ -179,7 +506,7 @@ def attach_tree_metadata(input_obj: Any, tree: list[dict[str, Any]], tooltip: st
     except Exception:
         pass
 
-    payload = {"sk_tree": tree}
+    payload = {"sk_tree": encoded}
     for attr in ("extra", "metadata", "ui"):
         try:
             setattr(input_obj, attr, payload)
@@ -6,7 +6,10 @@ from typing_extensions import override
 from comfy_api.latest import ComfyExtension, io
 
 import folder_paths
-from .tree_utils import ALLOWED_EXT, attach_tree_metadata, list_dirs, list_files, sanitize_rel_dir, _ensure_branch
+from .async_io import run_io
+from .io_scheduler import get_io_scheduler
+from .shared_cache import get_shared_cache, make_key
+from .tree_utils import attach_tree_metadata, list_dirs, list_files, sanitize_rel_dir, scan_folder, _ensure_branch
 
 BUILTIN_VAES = ["pixel_space", "taesd", "taesdxl", "taesd3", "taef1"]
 
@@ -33,18 +36,10 @@ def build_vae_tree(file_id: str) -> list[dict[str, Any]]:
             base_label = os.path.basename(base) or folder_type
             base_node: dict[str, Any] = {"label": f"{folder_type}:{base_label}", "value": None, "children": []}
 
-            for root, _, fnames in os.walk(base):
-                rel_root = os.path.relpath(root, base)
-                if rel_root in (".", ""):
-                    rel_root = ""
-                rel_root = rel_root.replace("\\", "/")
-
+            for rel_root, _, fnames in scan_folder(folder_type, base):
                 target_children = _ensure_branch(base_node["children"], rel_root.split("/"))
 
                 for fname in fnames:
-                    ext = os.path.splitext(fname.lower())[1]
-                    if ext not in ALLOWED_EXT:
-                        continue
                     rel_path = fname if rel_root == "" else f"{rel_root}/{fname}"
                     folder_val = f"{folder_type}/{rel_root}" if rel_root else folder_type
                     child_id = f"{file_id}__{sanitize_rel_dir(folder_val)}"
@@ -200,28 +195,38 @@ class VAELoader(io.ComfyNode):
 
     # TODO: scale factor?
     @classmethod
-    def execute(cls, vae: dict | str) -> io.NodeOutput:
+    async def execute(cls, vae: dict | str) -> io.NodeOutput:
         import torch
-        import comfy.sd
         import comfy.utils
 
-        resolved = resolve_selected_path(vae, "vae_folder", "vae_name")
+        resolved = await run_io(resolve_selected_path, vae, "vae_folder", "vae_name")
 
         # Check if it's a builtin VAE
         if resolved in ("pixel_space", "taesd", "taesdxl", "taesd3", "taef1"):
             if resolved == "pixel_space":
                 sd = {"pixel_space_vae": torch.tensor(1.0)}
             elif resolved in cls.image_taes:
-                sd = cls.load_taesd(resolved)
+                sd = await get_io_scheduler().submit(("taesd", resolved), 0, lambda: run_io(cls.load_taesd, resolved))
             else:
                 raise FileNotFoundError(f"Unknown builtin VAE: {resolved}")
-        else:
-            # Load VAE from file path
-            sd = comfy.utils.load_torch_file(resolved)
+            return io.NodeOutput(cls._build_vae(sd))
+
+        async def _load() -> tuple:
+            sd = await run_io(comfy.utils.load_torch_file, resolved)
+            return (cls._build_vae(sd),)
+
+        # Load VAE from file path, sharing the instance with other SK nodes
+        key = await run_io(make_key, "vae", resolved)
+        (vae,) = await get_shared_cache().aget_or_load(key, lambda: get_io_scheduler().schedule(key, resolved, _load))
+        return io.NodeOutput(vae)
+
+    @staticmethod
+    def _build_vae(sd: dict):
+        import comfy.sd
 
         vae = comfy.sd.VAE(sd=sd)
         vae.throw_exception_if_invalid()
-        return io.NodeOutput(vae)
+        return vae
 
 
 class VAEExtension(ComfyExtension):
@@ -50,22 +50,83 @@ function deriveTreeFromOptions(widget) {
   return root.length ? root : null;
 }
 
-function getTree(widget) {
-  const metaTree = (widget && widget.extra && widget.extra.sk_tree) || widget?.metadata?.sk_tree || widget?._sk_tree;
-  if (metaTree) return metaTree;
+function decodeCompactTree(data) {
+  // Compact format: {sk, g: [[folder, child_id, filePrefix], ...], t: nodes}.
+  // Folder node: [label, [children]]; leaf: [label, groupIndex] or [label, valueObject].
+  const groups = Array.isArray(data.g) ? data.g : [];
+  const decodeNode = (n) => {
+    const [label, rest] = n;
+    if (Array.isArray(rest)) {
+      return { label, value: null, children: rest.map(decodeNode) };
+    }
+    if (typeof rest === "number") {
+      const [folder, child_id, prefix] = groups[rest] || ["", "", ""];
+      return { label, value: { folder, file: `${prefix}${label}`, child_id }, children: [] };
+    }
+    return { label, value: rest ?? null, children: [] };
+  };
+  return Array.isArray(data.t) ? data.t.map(decodeNode) : null;
+}
+
+async function inflateBase64Gzip(b64) {
+  const bytes = Uint8Array.from(atob(b64), (c) => c.charCodeAt(0));
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+  return await new Response(stream).text();
+}
+
+// Returns a tree, a Promise of a tree (gzip payloads), or null.
+function decodeTreePayload(payload) {
+  if (payload == null) return null;
+  if (Array.isArray(payload)) return payload;
+  if (typeof payload === "object") return payload.sk ? decodeCompactTree(payload) : null;
+  if (typeof payload !== "string") return null;
+  if (payload.startsWith("gz:")) {
+    return inflateBase64Gzip(payload.substring(3)).then((json) => decodeTreePayload(JSON.parse(json)));
+  }
+  return decodeTreePayload(JSON.parse(payload));
+}
+
+function getTreePayload(widget) {
+  const meta = (widget && widget.extra && widget.extra.sk_tree) || widget?.metadata?.sk_tree || widget?._sk_tree;
+  if (meta) return meta;
   const tip = widget?.tooltip;
   if (typeof tip === "string") {
     const idx = tip.indexOf(TREE_SENTINEL);
-    if (idx >= 0) {
-      const json = tip.substring(idx + TREE_SENTINEL.length).split("]]")[0];
-      try {
-        return JSON.parse(json);
-      } catch (e) {
-        console.warn("SK Loader: failed to parse tree JSON from tooltip", e);
-      }
+    const end = tip.lastIndexOf("]]");
+    if (idx >= 0 && end > idx) {
+      return tip.substring(idx + TREE_SENTINEL.length, end);
     }
   }
-  return deriveTreeFromOptions(widget);
+  return null;
+}
+
+function hasTree(widget) {
+  return getTreePayload(widget) != null || deriveTreeFromOptions(widget) != null;
+}
+
+// Decode lazily on first use; caches the result (or pending Promise) on the widget.
+function getTree(widget) {
+  if (widget._sk_tree_decoded !== undefined) return widget._sk_tree_decoded;
+  let tree = null;
+  try {
+    tree = decodeTreePayload(getTreePayload(widget));
+  } catch (e) {
+    console.warn("SK Loader: failed to parse tree JSON from tooltip", e);
+  }
+  if (tree instanceof Promise) {
+    widget._sk_tree_decoded = tree;
+    tree
+      .then((t) => {
+        widget._sk_tree_decoded = t || deriveTreeFromOptions(widget);
+      })
+      .catch((e) => {
+        console.warn("SK Loader: failed to inflate tree payload", e);
+        widget._sk_tree_decoded = deriveTreeFromOptions(widget);
+      });
+    return tree;
+  }
+  widget._sk_tree_decoded = tree || deriveTreeFromOptions(widget);
+  return widget._sk_tree_decoded;
 }
 
 function ensureStyles() {
@@ -237,12 +298,27 @@ function attachTreeHandler(node) {
   for (const widget of node.widgets) {
     if (!widget || widget.type !== "combo") continue;
     if (widget._sk_tree_bound) continue;
-    const tree = getTree(widget);
-    if (!tree) continue;
+    if (!hasTree(widget)) continue;
     widget._sk_tree_bound = true;
 
     const prevMouseDown = widget.onMouseDown;
     widget.onMouseDown = function (e, pos, graphcanvas) {
+      const tree = getTree(widget);
+      if (tree instanceof Promise) {
+        // Still inflating: open the menu as soon as the tree is ready.
+        tree
+          .then(() => {
+            let ready = getTree(widget);
+            if (ready instanceof Promise) ready = deriveTreeFromOptions(widget);
+            openTreeMenu(widget, ready, e, node, graphcanvas);
+          })
+          .catch((err) => {
+            console.warn("SK Loader: failed to decode tree, falling back to combo options", err);
+            widget._sk_tree_decoded = deriveTreeFromOptions(widget);
+            openTreeMenu(widget, widget._sk_tree_decoded, e, node, graphcanvas);
+          });
+        return true;
+      }
       const handled = openTreeMenu(widget, tree, e, node, graphcanvas);
       if (handled) return true;
       if (prevMouseDown) return prevMouseDown.call(widget, e, pos, graphcanvas);